@@ -1,7 +1,7 @@
 """Doxibox voice assistant core package."""
 from .config import DoxiConfig
 from .wakeword import WakeWordDetector
-from .asr import WhisperASR
+from .asr import BatchingASR, WhisperASR
 from .llm import LLMRouter
 from .agent import AgentOrchestrator
 from .audio_input import AudioInput
@@ -12,6 +12,7 @@ __all__ = [
     "DoxiConfig",
     "WakeWordDetector",
     "WhisperASR",
+    "BatchingASR",
     "LLMRouter",
     "AgentOrchestrator",
     "AudioInput",
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import re
 from dataclasses import dataclass, field
-from dataclasses import dataclass, field
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from .config import DoxiConfig
 from .llm import LLMRouter
 
+logger = logging.getLogger(__name__)
+
+# "- ", "* " or "1. " / "1) " in front of a predicted follow-up.
+LIST_MARKER = re.compile(r"^\s*(?:[-*]|\d+[.)])\s+")
+
+FOLLOWUP_CONTEXT = (
+    "Predict the short follow-up requests the user is most likely to say next. "
+    "Reply with one request per line and nothing else."
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentStep:
     thought: str
     action: str
     observation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     steps: List[AgentStep] = field(default_factory=list)
     final_response: str = ""
@@ -27,24 +39,95 @@ class AgentOrchestrator:
     This keeps the interface flexible for future tool integrations while
     satisfying the specification's Agent Mode requirement with deterministic and
     test-friendly behavior.
+
+    ``run_async`` is the "fast talker": it answers the current prompt. When
+    ``config.prefetch_followups`` is set, a background "slow thinker" task asks
+    the LLM for likely follow-ups and answers them ahead of time so that they
+    land in the router's response cache before the user says them.
     """
 
     def __init__(self, config: DoxiConfig, llm: LLMRouter) -> None:
         self.config = config
         self.llm = llm
+        self._queue: Optional[asyncio.Queue[str]] = None
+        self._thinker: Optional[asyncio.Task[None]] = None
 
     def run(self, prompt: str) -> AgentResult:
         if not self.config.enable_agent_mode:
-            response = self.llm.generate(prompt).text
+            response = self.llm.generate_text(prompt)
             return AgentResult(final_response=response)
 
         steps = [
             AgentStep(thought="Assessing user intent", action="echo"),
             AgentStep(thought="Executing requested task", action="llm.generate"),
         ]
-        final = self.llm.generate(prompt, context="agent-mode").text
+        final = self.llm.generate_text(prompt, context="agent-mode")
         return AgentResult(steps=steps, final_response=final)
 
     def run_streaming(self, prompt: str) -> Iterable[str]:
-        for token in self.llm.generate_streaming(prompt, context="agent-mode"):
+        context = "agent-mode" if self.config.enable_agent_mode else None
+        for token in self.llm.generate_streaming(prompt, context=context):
             yield token
+
+    # --- Async pipeline -------------------------------------------------
+    async def start(self) -> None:
+        if not self.config.prefetch_followups or self._thinker is not None:
+            return
+        # Only the latest turn is worth predicting from, so keep one slot.
+        self._queue = asyncio.Queue(maxsize=1)
+        self._thinker = asyncio.create_task(self._slow_thinker())
+
+    async def close(self) -> None:
+        if self._thinker is None:
+            return
+        self._thinker.cancel()
+        try:
+            await self._thinker
+        except asyncio.CancelledError:
+            pass
+        self._thinker = None
+        self._queue = None
+
+    async def run_async(self, prompt: str) -> AgentResult:
+        result = await asyncio.to_thread(self.run, prompt)
+        self.submit(prompt)
+        return result
+
+    def submit(self, prompt: str) -> None:
+        """Queue ``prompt`` for follow-up prediction; a no-op unless started."""
+        if self._queue is None:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(prompt)
+
+    async def _slow_thinker(self) -> None:
+        assert self._queue is not None
+        while True:
+            prompt = await self._queue.get()
+            try:
+                await self._prefetch(prompt)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # background work must never break a foreground turn
+                logger.debug("Follow-up prefetch failed for %r", prompt, exc_info=True)
+
+    async def _prefetch(self, prompt: str) -> None:
+        prediction = await asyncio.to_thread(self.llm.generate_text, prompt, FOLLOWUP_CONTEXT)
+        candidates = self._parse_followups(prediction)
+        if not candidates:
+            return
+        # Use the same context as ``run`` so the cache keys match a real turn;
+        # providers answer the candidates as one batch (Modal fans out with .map()).
+        context = "agent-mode" if self.config.enable_agent_mode else None
+        await asyncio.to_thread(self.llm.generate_many, candidates, context)
+
+    def _parse_followups(self, text: str) -> List[str]:
+        candidates: List[str] = []
+        for line in text.splitlines():
+            candidate = LIST_MARKER.sub("", line, count=1).strip()
+            if candidate:
+                candidates.append(candidate)
+            if len(candidates) >= self.config.prefetch_max_candidates:
+                break
+        return candidates
@@ -1,16 +1,56 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import math
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .config import DoxiConfig
+from .vad import SileroVAD, group_spans
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TranscriptSegment:
     text: str
     confidence: float = 1.0
+    start: Optional[float] = None  # seconds from the start of the clip
+    end: Optional[float] = None
+    # Lower-cased, stripped text computed once here for wake-word/intent matching.
+    normalized: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "normalized", self.text.strip().lower())
+
+
+WHISPER_SAMPLE_RATE = 16000
+WHISPER_WINDOW_SAMPLES = 30 * WHISPER_SAMPLE_RATE
+WARMUP_CALLS = 3
+# ``whisper.transcribe`` defaults for treating a window as silence.
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+
+# Distil-Whisper drafts that share a tokenizer with the matching OpenAI checkpoint.
+ASSISTANT_MODELS = {
+    "medium.en": "distil-whisper/distil-small.en",
+    "large-v2": "distil-whisper/distil-large-v2",
+    "large-v3": "distil-whisper/distil-large-v3",
+}
+
+
+def _enable_numba_cache() -> None:
+    """Persist Whisper's Numba-compiled DTW kernels so restarts skip the JIT."""
+    try:  # pragma: no cover - optional dependency
+        from whisper import timing  # type: ignore
+    except ImportError:  # pragma: no cover
+        return
+    for name in ("backtrace", "dtw_cpu"):
+        enable_caching = getattr(getattr(timing, name, None), "enable_caching", None)
+        if enable_caching is not None:
+            enable_caching()
 
 
 class WhisperASR:
@@ -18,16 +58,45 @@ class WhisperASR:
 
     Uses the `openai-whisper` reference implementation by default. When the
     dependency is missing, a clear error guides the user to install the ASR
-    extras.
+    extras. On CUDA devices the HuggingFace `transformers` port is used instead,
+    with SDPA attention, a static KV cache and a ``torch.compile``d forward so
+    that decoding runs as CUDA graphs rather than per-token Python dispatch.
+    When a Distil-Whisper assistant is available for the chosen model size, it
+    drafts tokens that the main model verifies (speculative decoding); the
+    output is identical to plain greedy decoding. For CPU-only boxes,
+    ``backend="onnx-int8"`` runs an int8 dynamically quantized ONNX export
+    through ONNX Runtime.
     """
 
     def __init__(self, config: DoxiConfig) -> None:
         self.config = config
         self._whisper = None
+        self._processor = None
+        self._assistant = None
+        self._vad: Optional[SileroVAD] = None
+        self._feature_cache: Dict[Any, Tuple[Any, Any]] = {}
+
+    def _backend(self) -> str:
+        if self.config.backend != "auto":
+            return self.config.backend
+        return "transformers" if self.config.device.startswith("cuda") else "openai-whisper"
+
+    def _use_transformers(self) -> bool:
+        """Both the compiled CUDA model and the ONNX model share the HF generate API."""
+        return self._backend() in ("transformers", "onnx-int8")
 
     def _load_model(self):
         if self._whisper:
             return self._whisper
+        backend = self._backend()
+        if backend == "transformers":
+            self._whisper = self._load_transformers_model()
+            return self._whisper
+        if backend == "onnx-int8":
+            self._whisper = self._load_onnx_model()
+            return self._whisper
+        if backend != "openai-whisper":
+            raise ValueError(f"Unknown ASR backend '{backend}'.")
         try:  # pragma: no cover - optional dependency
             import whisper  # type: ignore
         except ImportError as exc:  # pragma: no cover
@@ -36,18 +105,377 @@ class WhisperASR:
             ) from exc
         device = None if self.config.device == "auto" else self.config.device
         self._whisper = whisper.load_model(self.config.model_size, device=device)
+        if self.config.word_timestamps:
+            _enable_numba_cache()
         return self._whisper
 
-    def transcribe(self, audio_path_or_bytes: str | bytes | Path) -> List[TranscriptSegment]:
+    def warmup(self) -> None:
+        """Load the model and pay one-off JIT/compile costs before the first turn.
+
+        Decodes one second of silence and, when word timestamps are enabled,
+        compiles Whisper's Numba DTW kernels, which silence alone never reaches.
+        """
+        import numpy as np  # lazy import
+
+        silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
         whisper_model = self._load_model()
+        if self._use_transformers():
+            self._transcribe_transformers([silence])
+            return
+        whisper_model.transcribe(silence, word_timestamps=self.config.word_timestamps)
+        if self.config.word_timestamps:
+            from whisper import timing  # type: ignore
+
+            timing.dtw_cpu(np.zeros((2, 2)))
+
+    def _load_transformers_model(self):
+        try:  # pragma: no cover - optional dependency
+            import torch
+            from transformers import WhisperForConditionalGeneration, WhisperProcessor  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError(
+                "The 'transformers' ASR backend requires 'transformers' and 'torch'. "
+                "Install with 'pip install doxibox[asr-cuda]'"
+            ) from exc
+        model_id = self._transformers_model_id()
+        device = self.config.device
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        on_cuda = device.startswith("cuda")
+        dtype = torch.float16 if on_cuda else torch.float32
+        self._processor = WhisperProcessor.from_pretrained(model_id)
+        model = WhisperForConditionalGeneration.from_pretrained(
+            model_id, attn_implementation="sdpa", torch_dtype=dtype
+        ).to(device)
+        model.eval()
+        # Draft-and-verify and CUDA graphs only pay off on a GPU.
+        assistant_id = self._assistant_model_id() if on_cuda else None
+        if assistant_id:
+            self._assistant = WhisperForConditionalGeneration.from_pretrained(
+                assistant_id, attn_implementation="sdpa", torch_dtype=dtype
+            ).to(device)
+            self._assistant.eval()
+        # Assisted generation cannot use a static cache, so the draft model
+        # takes the place of the compiled decoder when both are available.
+        elif on_cuda and self.config.asr_compile:
+            import torch._dynamo
+            import torch._inductor.config
+
+            torch._inductor.config.fx_graph_cache = True
+            torch._dynamo.config.cache_size_limit = 32
+            # A fixed-shape KV cache keeps the compiled graph valid across steps.
+            model.generation_config.cache_implementation = "static"
+            model.forward = torch.compile(model.forward, mode="reduce-overhead")
+            self._warmup_transformers(model)
+        return model
+
+    def _load_onnx_model(self):
+        options = self.config.backend_options
+        model_path = options.get("model_path")
+        if not model_path:
+            # Nothing downloads this directory, so fail with export steps
+            # instead of a confusing hub lookup error.
+            default_path = self.config.cache_dir / f"whisper-{self.config.model_size}-onnx-int8"
+            if not default_path.is_dir():
+                raise RuntimeError(
+                    f"No int8 ONNX Whisper export found at '{default_path}'. Create one with "
+                    f"'optimum-cli export onnx --model {self._transformers_model_id()} <tmp>' and "
+                    f"'optimum-cli onnxruntime quantize --avx2 --onnx_model <tmp> -o {default_path}', "
+                    "or set backend_options['model_path'] to an export directory or hub repo id."
+                )
+            model_path = str(default_path)
+        try:  # pragma: no cover - optional dependency
+            from optimum.onnxruntime import ORTModelForSpeechSeq2Seq  # type: ignore
+            from transformers import WhisperProcessor  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError(
+                "The 'onnx-int8' ASR backend requires 'optimum[onnxruntime]'. "
+                "Install with 'pip install doxibox[asr-onnx]'"
+            ) from exc
+        self._processor = WhisperProcessor.from_pretrained(
+            options.get("processor") or self._transformers_model_id()
+        )
+        return ORTModelForSpeechSeq2Seq.from_pretrained(
+            model_path,
+            encoder_file_name=options.get("encoder", "encoder_model.onnx"),
+            decoder_file_name=options.get("decoder", "decoder_model.onnx"),
+            decoder_with_past_file_name=options.get(
+                "decoder_with_past", "decoder_with_past_model.onnx"
+            ),
+            provider="CPUExecutionProvider",
+        )
+
+    def _transformers_model_id(self) -> str:
+        if "/" in self.config.model_size:
+            return self.config.model_size
+        return f"openai/whisper-{self.config.model_size}"
+
+    def _assistant_model_id(self) -> str | None:
+        choice = self.config.assistant_model
+        if not choice or choice == "none":
+            return None
+        if choice == "auto":
+            return ASSISTANT_MODELS.get(self.config.model_size)
+        return choice
+
+    def _warmup_transformers(self, model) -> None:
+        """Pay the compile/CUDA-graph capture cost at load time, not on the first turn."""
+        import torch
+
+        silence = torch.zeros(
+            (1, model.config.num_mel_bins, 3000), dtype=model.dtype, device=model.device
+        )
+        generate_kwargs = self._generate_kwargs(model)
+        with torch.inference_mode():
+            for _ in range(WARMUP_CALLS):
+                model.generate(silence, **generate_kwargs)
+
+    def _generate_kwargs(self, model) -> Dict[str, Any]:
+        """Language/task hints for ``generate``; English-only (``*.en``) models reject them."""
+        if not getattr(model.generation_config, "is_multilingual", True):
+            return {}
+        return {"language": self.config.language, "task": "transcribe"}
+
+    def _transcribe_transformers(self, audio_arrays: Sequence[Any]) -> List[TranscriptSegment]:
+        import torch
+
+        model = self._load_model()
+        inputs = self._processor.feature_extractor(
+            [self._as_float32(audio) for audio in audio_arrays],
+            sampling_rate=WHISPER_SAMPLE_RATE,
+            return_tensors="pt",
+            device=str(model.device),
+        )
+        features = inputs.input_features
+        if self._backend() == "transformers":
+            features = features.to(model.device, dtype=model.dtype)
+        generate_kwargs = self._generate_kwargs(model)
+        # Speculative decoding only supports a batch of one.
+        if self._assistant is not None and features.shape[0] == 1:
+            generate_kwargs["assistant_model"] = self._assistant
+        with torch.inference_mode():
+            tokens = model.generate(features, **generate_kwargs)
+        texts = self._processor.batch_decode(tokens, skip_special_tokens=True)
+        return [TranscriptSegment(text=text.strip()) for text in texts]
+
+    @staticmethod
+    def _as_float32(audio: Any) -> Any:
+        import numpy as np  # lazy import
+
+        return np.asarray(audio, dtype=np.float32).reshape(-1)
+
+    @staticmethod
+    def _read_audio(audio_path_or_bytes: str | bytes | Path) -> Any:
+        """Decode through an ffmpeg pipe, like ``whisper.load_audio`` but also for bytes.
+
+        Needs only the ``ffmpeg`` binary, so every backend can decode bytes.
+        """
+        import subprocess
+
+        import numpy as np  # lazy import
+
+        source, stdin = "pipe:0", audio_path_or_bytes
         if isinstance(audio_path_or_bytes, (str, Path)):
-            result = whisper_model.transcribe(str(audio_path_or_bytes))
+            source, stdin = str(audio_path_or_bytes), None
+        cmd = [
+            "ffmpeg", "-nostdin", "-threads", "0", "-i", source,
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(WHISPER_SAMPLE_RATE), "-",
+        ]
+        try:
+            out = subprocess.run(cmd, input=stdin, capture_output=True, check=True).stdout
+        except FileNotFoundError as exc:
+            raise RuntimeError(
+                "Decoding audio requires the 'ffmpeg' binary on PATH (see the README's ASR notes)."
+            ) from exc
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f"Failed to decode audio: {exc.stderr.decode(errors='ignore')}") from exc
+        return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+    def load_audio(self, audio_path_or_bytes: str | bytes | Path | np.ndarray) -> Any:
+        """Decode an audio file (or encoded bytes) to a 16 kHz mono float32 array.
+
+        Arrays are assumed to already be 16 kHz samples and are only cast.
+        Decoding never touches the model, so concurrent callers (e.g. the
+        CLI's file path) do not race to load it.
+        """
+        if not isinstance(audio_path_or_bytes, (str, bytes, Path)):
+            return self._as_float32(audio_path_or_bytes)
+        return self._read_audio(audio_path_or_bytes)
+
+    def transcribe(
+        self, audio_path_or_bytes: str | bytes | Path | np.ndarray
+    ) -> List[TranscriptSegment]:
+        """Transcribe a file, encoded bytes, or an in-memory 16 kHz float32 array.
+
+        Arrays are handed to the model directly, skipping the WAV write and the
+        ffmpeg decode that a file path costs.
+        """
+        whisper_model = self._load_model()
+        if (
+            isinstance(audio_path_or_bytes, (str, Path))
+            and not self.config.use_vad
+            and not self._use_transformers()
+        ):
+            # openai-whisper decodes the file itself and handles long-form audio.
+            audio = str(audio_path_or_bytes)
         else:
-            result = whisper_model.transcribe(audio_path_or_bytes)
+            audio = self.load_audio(audio_path_or_bytes)
+            if len(audio) > WHISPER_WINDOW_SAMPLES and (
+                self.config.use_vad or self._use_transformers()
+            ):
+                return self._transcribe_long(audio)
+        if self._use_transformers():
+            return self._transcribe_transformers([audio])
+        # Word timings run a Numba DTW pass per segment; skip it unless asked.
+        result = whisper_model.transcribe(audio, word_timestamps=self.config.word_timestamps)
+        if self.config.word_timestamps:
+            return [
+                TranscriptSegment(
+                    text=segment["text"].strip(), start=segment["start"], end=segment["end"]
+                )
+                for segment in result.get("segments", [])
+            ]
         text = (result.get("text") or "").strip()
         return [TranscriptSegment(text=text, confidence=float(result.get("confidence", 1.0)))]
 
-    def transcribe_text(self, audio_path_or_bytes: str | bytes | Path) -> str:
+    def _transcribe_long(self, audio: Any) -> List[TranscriptSegment]:
+        """Long-form path: one timed segment per window of <= 30 s, decoded in batches."""
+        windows = self._windows(audio)
+        decoded = self.transcribe_batch([audio[start:end] for start, end in windows])
+        return [
+            TranscriptSegment(
+                text=segment.text,
+                confidence=segment.confidence,
+                start=start / WHISPER_SAMPLE_RATE,
+                end=end / WHISPER_SAMPLE_RATE,
+            )
+            for (start, end), segment in zip(windows, decoded)
+        ]
+
+    def transcribe_batch(self, audio_arrays: Sequence[Any]) -> List[TranscriptSegment]:
+        """Transcribe several 16 kHz float32 clips, returning one segment per clip.
+
+        Clips longer than Whisper's 30 s window are cut into windows (see
+        :meth:`_windows`) that are decoded alongside the other clips, and the
+        window texts are joined back into that clip's segment. Windows are decoded in
+        batches of at most ``config.asr_max_batch``.
+        """
+        if not audio_arrays:
+            return []
+        windows: List[Any] = []
+        owners: List[int] = []
+        for index, audio in enumerate(audio_arrays):
+            for start, end in self._windows(audio):
+                windows.append(audio[start:end])
+                owners.append(index)
+        decoded: List[TranscriptSegment] = []
+        step = max(1, self.config.asr_max_batch)
+        for offset in range(0, len(windows), step):
+            decoded.extend(self._decode_batch(windows[offset : offset + step]))
+        if owners == list(range(len(audio_arrays))):
+            return decoded
+        parts: List[List[TranscriptSegment]] = [[] for _ in audio_arrays]
+        for owner, segment in zip(owners, decoded):
+            parts[owner].append(segment)
+        return [
+            TranscriptSegment(
+                text=" ".join(segment.text for segment in segments if segment.text),
+                confidence=min((segment.confidence for segment in segments), default=1.0),
+            )
+            for segments in parts
+        ]
+
+    def _windows(self, audio: Any) -> List[Tuple[int, int]]:
+        """``(start, end)`` sample ranges of ``audio`` that each fit one 30 s window.
+
+        With ``config.use_vad``, long clips are cut on Silero VAD speech spans
+        (silence is dropped); otherwise into consecutive 30 s windows.
+        """
+        total = len(audio)
+        if total <= WHISPER_WINDOW_SAMPLES:
+            return [(0, total)]
+        if self.config.use_vad:
+            if self._vad is None:
+                self._vad = SileroVAD(self.config)
+            spans = self._vad.speech_spans(audio, WHISPER_SAMPLE_RATE)
+            return group_spans(spans, WHISPER_WINDOW_SAMPLES)
+        return [
+            (start, min(start + WHISPER_WINDOW_SAMPLES, total))
+            for start in range(0, total, WHISPER_WINDOW_SAMPLES)
+        ]
+
+    def _decode_batch(self, audio_arrays: Sequence[Any]) -> List[TranscriptSegment]:
+        """Decode clips of at most 30 s with one encoder/decoder pass.
+
+        Feature extraction runs on the model's device for the whole batch: clips
+        are padded to Whisper's 30 s window, stacked to ``(B, N)`` and turned into
+        log-mel features with a cached Hann window and mel filter bank.
+        """
+        whisper_model = self._load_model()
+        if self._use_transformers():
+            return self._transcribe_transformers(audio_arrays)
+        import torch  # lazy import, installed with openai-whisper
+        import whisper  # type: ignore
+
+        device = whisper_model.device
+        n_samples = whisper.audio.N_SAMPLES
+        batch = torch.zeros((len(audio_arrays), n_samples), dtype=torch.float32, device=device)
+        for row, audio in enumerate(audio_arrays):
+            clip = torch.as_tensor(audio, dtype=torch.float32).flatten()[:n_samples]
+            batch[row, : clip.shape[0]] = clip.to(device)
+
+        fp16 = device.type != "cpu"
+        mel = self._log_mel_batch(batch)
+        with torch.no_grad():
+            features = whisper_model.embed_audio(mel.half() if fp16 else mel)
+            options = whisper.DecodingOptions(
+                language=self.config.language, without_timestamps=True, fp16=fp16
+            )
+            results = whisper_model.decode(features, options)
+        return [
+            TranscriptSegment(
+                # Same silence gate as ``whisper.transcribe``: drop text the
+                # model itself believes is not speech.
+                text=""
+                if result.no_speech_prob > NO_SPEECH_THRESHOLD
+                and result.avg_logprob < LOGPROB_THRESHOLD
+                else result.text.strip(),
+                confidence=math.exp(result.avg_logprob),
+            )
+            for result in results
+        ]
+
+    def _log_mel_batch(self, batch):
+        """Batched port of ``whisper.log_mel_spectrogram`` with cached device tensors."""
+        import torch
+        import whisper  # type: ignore
+
+        window, filters = self._feature_tensors(batch.device)
+        stft = torch.stft(
+            batch, whisper.audio.N_FFT, whisper.audio.HOP_LENGTH, window=window, return_complex=True
+        )
+        magnitudes = stft[..., :-1].abs() ** 2
+        log_spec = torch.clamp(filters @ magnitudes, min=1e-10).log10()
+        # Whisper clamps against the clip's own peak, so take the max per item.
+        peak = log_spec.amax(dim=(-2, -1), keepdim=True)
+        log_spec = torch.maximum(log_spec, peak - 8.0)
+        return (log_spec + 4.0) / 4.0
+
+    def _feature_tensors(self, device):
+        cached = self._feature_cache.get(device)
+        if cached is not None:
+            return cached
+        import torch
+        import whisper  # type: ignore
+
+        window = torch.hann_window(whisper.audio.N_FFT, device=device)
+        filters = torch.as_tensor(
+            whisper.audio.mel_filters(device, self._whisper.dims.n_mels), device=device
+        )
+        self._feature_cache[device] = (window, filters)
+        return window, filters
+
+    def transcribe_text(self, audio_path_or_bytes: str | bytes | Path | np.ndarray) -> str:
         segments = self.transcribe(audio_path_or_bytes)
         return " ".join(segment.text for segment in segments if segment.text)
 
@@ -58,3 +486,78 @@ class WhisperASR:
             else:
                 text = str(chunk)
             yield TranscriptSegment(text=text.strip())
+
+
+class BatchingASR:
+    """Dynamic batcher in front of :meth:`WhisperASR.transcribe_batch`.
+
+    Concurrent ``await transcribe(clip)`` calls are held for up to
+    ``max_wait_s`` (or until ``max_batch_size`` clips are waiting), decoded in
+    one batched pass on a worker thread, and the segments are fanned back out
+    to the individual callers.
+    """
+
+    def __init__(self, asr: WhisperASR, max_batch_size: int = 8, max_wait_s: float = 0.05) -> None:
+        self.asr = asr
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_s = max_wait_s
+        self._queue: Optional[asyncio.Queue[Tuple[Any, asyncio.Future]]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+
+    async def transcribe(self, audio: Any) -> TranscriptSegment:
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio, future))
+        return await future
+
+    async def close(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+        self._worker = None
+        self._queue = None
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait_s
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                segments = await asyncio.to_thread(
+                    self.asr.transcribe_batch, [audio for audio, _ in batch]
+                )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), segment in zip(batch, segments):
+                if not future.done():
+                    future.set_result(segment)
@@ -1,33 +1,65 @@
 from __future__ import annotations
 
+import math
+import threading
 import wave
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Iterator, List, Optional
 
 from .config import DoxiConfig
-from .asr import WhisperASR
+from .asr import WHISPER_SAMPLE_RATE, WhisperASR
 
+BLOCK_SIZE = 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class CapturedAudio:
     """A captured utterance.
 
     The text is filled via ASR for microphone recordings, or directly when using
-    text-based simulation.
+    text-based simulation. ``normalized`` (stripped, lower-cased) is taken from
+    the ASR segment when available and computed once otherwise.
     """
 
     text: str
     path: Optional[Path] = None
     sample_rate: Optional[int] = None
+    normalized: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.normalized is None:
+            self.normalized = self.text.strip().lower()
 
 
 class AudioInput:
-    """Microphone + text fallback input pipeline."""
+    """Microphone + text fallback input pipeline.
+
+    Microphone capture keeps one PortAudio input stream open for the whole
+    session. Its callback copies blocks into a preallocated buffer only while a
+    capture is armed, so each utterance avoids the stream setup/teardown that
+    ``sd.rec`` performs on every call.
+    """
 
     def __init__(self, config: DoxiConfig, asr: Optional[WhisperASR] = None) -> None:
         self.config = config
         self.asr = asr
+        self._stream = None
+        self._buffer: Any = None
+        self._write_pos = 0
+        self._recording = False
+        self._buffer_full = threading.Event()
+        self._f32_scratch: Any = None
+        self._i16_scratch: Any = None
+        self._soundfile: Any = None
+        self._batch_size = max(1, config.asr_batch_size)
+        if self._batch_size == 1:
+            self._wav_paths = [config.cache_dir / "capture.wav"]
+        else:
+            self._wav_paths = [config.cache_dir / f"capture-{i}.wav" for i in range(self._batch_size)]
+        if config.input_mode == "microphone" and config.persist_captures:
+            # Create the capture directory once rather than on every write.
+            config.cache_dir.mkdir(parents=True, exist_ok=True)
 
     # --- Public API -----------------------------------------------------
     def record(self, prompts: Optional[List[str]] = None) -> Iterable[CapturedAudio]:
@@ -48,46 +80,172 @@ class AudioInput:
     # --- Microphone mode ------------------------------------------------
     def _record_microphone(self) -> Iterator[CapturedAudio]:
         sd = self._load_sounddevice()
-        cache_dir = self.config.cache_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        pending: List[tuple[Any, Optional[Path]]] = []
         print("Press Enter to record. Type 'q' and Enter to quit.")
-        while True:
-            user = input(">>> Ready. Hit Enter to capture up to %ss: " % self.config.max_record_seconds)
-            if user.strip().lower() == "q":
-                break
-            audio = self._capture_once(sd)
-            wav_path = cache_dir / "capture.wav"
-            self._write_wav(wav_path, audio, self.config.sample_rate)
-            transcript = self.asr.transcribe_text(wav_path)
-            yield CapturedAudio(text=transcript, path=wav_path, sample_rate=self.config.sample_rate)
+        try:
+            while True:
+                user = input(">>> Ready. Hit Enter to capture up to %ss: " % self.config.max_record_seconds)
+                if user.strip().lower() == "q":
+                    break
+                audio = self._capture_once(sd)
+                # ASR consumes the array directly; WAV files are only for inspection.
+                wav_path = None
+                if self.config.persist_captures:
+                    wav_path = self._wav_paths[len(pending)]
+                    self._write_wav(wav_path, audio, self.config.sample_rate)
+                pending.append((audio, wav_path))
+                if len(pending) >= self._batch_size:
+                    yield from self._flush(pending)
+                    pending = []
+            yield from self._flush(pending)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop and release the microphone stream, if one is open."""
+        if self._stream is None:
+            return
+        self._recording = False
+        self._stream.stop()
+        self._stream.close()
+        self._stream = None
+
+    def _flush(self, pending: List[tuple[Any, Optional[Path]]]) -> Iterator[CapturedAudio]:
+        if not pending:
+            return
+        clips = [self._prepare_clip(audio) for audio, _ in pending]
+        if len(clips) == 1:
+            # A lone clip gains nothing from batching; the full transcribe path
+            # keeps Whisper's no-speech and temperature-fallback guards.
+            (_, wav_path), = pending
+            yield CapturedAudio(
+                text=self.asr.transcribe_text(clips[0]),
+                path=wav_path,
+                sample_rate=self.config.sample_rate,
+            )
+            return
+        segments = self.asr.transcribe_batch(clips)
+        for (_, wav_path), segment in zip(pending, segments):
+            yield CapturedAudio(
+                text=segment.text,
+                path=wav_path,
+                sample_rate=self.config.sample_rate,
+                normalized=segment.normalized,
+            )
+
+    def _prepare_clip(self, audio: Any) -> Any:
+        """Downmix to mono and resample to the 16 kHz rate Whisper expects.
+
+        Resampling uses a polyphase filter, whose low-pass stage keeps 44.1/48
+        kHz captures from aliasing into the speech band.
+        """
+        import numpy as np  # lazy import
+
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        if self.config.sample_rate == WHISPER_SAMPLE_RATE:
+            return audio
+        try:  # pragma: no cover - optional dependency
+            from scipy.signal import resample_poly  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError(
+                f"Capturing at {self.config.sample_rate} Hz requires 'scipy' to resample to "
+                f"{WHISPER_SAMPLE_RATE} Hz. Install with 'pip install doxibox[audio]' "
+                f"or set sample_rate={WHISPER_SAMPLE_RATE}."
+            ) from exc
+        ratio = math.gcd(WHISPER_SAMPLE_RATE, self.config.sample_rate)
+        resampled = resample_poly(
+            audio, WHISPER_SAMPLE_RATE // ratio, self.config.sample_rate // ratio
+        )
+        return resampled.astype(np.float32, copy=False)
 
     def _capture_once(self, sd_module) -> Any:
         import numpy as np  # lazy import to keep text-mode lightweight
 
+        self._open_stream(sd_module)
         duration = self.config.max_record_seconds
         print("Recording...")
-        frames = sd_module.rec(
-            int(duration * self.config.sample_rate),
+        self._write_pos = 0
+        self._buffer_full.clear()
+        self._recording = True
+        # The callback sets the event once the buffer holds ``duration`` seconds.
+        self._buffer_full.wait(timeout=duration + 1.0)
+        self._recording = False
+        audio = np.squeeze(self._buffer[: self._write_pos].copy())
+        print("Captured.")
+        return audio
+
+    def _open_stream(self, sd_module) -> None:
+        if self._stream is not None:
+            return
+        import numpy as np  # lazy import
+
+        frames = int(self.config.max_record_seconds * self.config.sample_rate)
+        self._buffer = np.zeros((frames, self.config.channels), dtype=np.float32)
+        self._stream = sd_module.InputStream(
             samplerate=self.config.sample_rate,
             channels=self.config.channels,
             dtype="float32",
+            blocksize=BLOCK_SIZE,
+            callback=self._on_block,
         )
-        sd_module.wait()
-        audio = np.squeeze(frames)
-        print("Captured.")
-        return audio
+        self._stream.start()
+
+    def _on_block(self, indata, frames, time_info, status) -> None:
+        # Runs on the PortAudio thread: copy into the preallocated buffer only.
+        if not self._recording:
+            return
+        start = self._write_pos
+        end = min(start + frames, len(self._buffer))
+        self._buffer[start:end] = indata[: end - start]
+        self._write_pos = end
+        if end == len(self._buffer):
+            self._recording = False
+            self._buffer_full.set()
 
     # --- Utilities ------------------------------------------------------
     def _write_wav(self, path: Path, audio: Any, sample_rate: int) -> None:
         import numpy as np  # lazy import
 
-        path.parent.mkdir(parents=True, exist_ok=True)
+        samples = audio.size
+        f32, i16 = self._wav_scratch(samples)
+        # Clip into a reusable float32 buffer so the caller's array (still
+        # needed for ASR) is left untouched and nothing is upcast to float64.
+        np.clip(audio.reshape(-1), -1.0, 1.0, out=f32)
+        sf = self._load_soundfile()
+        if sf is not None:
+            # libsndfile quantizes float32 to PCM_16 in C, without a bytes copy.
+            sf.write(str(path), f32.reshape(audio.shape), sample_rate, subtype="PCM_16")
+            return
+        np.multiply(f32, np.float32(np.iinfo(np.int16).max), out=f32)
+        np.rint(f32, out=f32)
+        i16[:] = f32
+        channels = self.config.channels
         with wave.open(str(path), "wb") as wf:
-            wf.setnchannels(self.config.channels)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            max_amp = np.iinfo(np.int16).max
-            wf.writeframes((audio * max_amp).astype(np.int16).tobytes())
+            # Declaring the frame count up front lets close() skip the header patch.
+            wf.setparams((channels, 2, sample_rate, samples // channels, "NONE", "not compressed"))
+            wf.writeframesraw(i16)
+
+    def _wav_scratch(self, samples: int) -> tuple[Any, Any]:
+        import numpy as np  # lazy import
+
+        if self._i16_scratch is None or len(self._i16_scratch) < samples:
+            capacity = max(
+                samples,
+                int(self.config.max_record_seconds * self.config.sample_rate) * self.config.channels,
+            )
+            self._f32_scratch = np.empty(capacity, dtype=np.float32)
+            self._i16_scratch = np.empty(capacity, dtype=np.int16)
+        return self._f32_scratch[:samples], self._i16_scratch[:samples]
+
+    def _load_soundfile(self):
+        if self._soundfile is None:
+            try:  # pragma: no cover - optional external dependency
+                import soundfile  # type: ignore
+            except (ImportError, OSError):  # minimal install or missing libsndfile
+                soundfile = False
+            self._soundfile = soundfile
+        return self._soundfile or None
 
     def _load_sounddevice(self):
         try:  # pragma: no cover - optional external dependency
@@ -1,35 +1,145 @@
 from __future__ import annotations
 
-from typing import Iterable
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
 
 from .config import DoxiConfig
 
+logger = logging.getLogger(__name__)
+
+SENTENCE_END = (".", "!", "?")
+
 
 class AudioOutput:
-    """Text logging plus optional on-device TTS."""
+    """Text logging plus optional on-device TTS.
+
+    ``history`` keeps the most recent ``config.history_max`` entries as raw
+    ``(tag, text)`` pairs; the ``[tag] text`` lines are only rendered when the
+    history is read through iteration or :meth:`formatted`.
+
+    Speech is rendered by a single pyttsx3 engine owned by a worker thread, so
+    ``speak`` only enqueues text and returns; call :meth:`flush` to wait for it.
+    """
 
     def __init__(self, config: DoxiConfig) -> None:
         self.config = config
-        self.history: list[str] = []
+        self.history: Deque[Tuple[str, str]] = deque(maxlen=config.history_max or None)
+        self._voice_tag = f"voice:{config.language}"
         self._tts_engine = None
+        self._tts_queue: "Optional[queue.Queue[Optional[str]]]" = None
+        self._tts_thread: Optional[threading.Thread] = None
+
+    def __iter__(self) -> Iterator[str]:
+        for tag, text in self.history:
+            yield f"[{tag}] {text}"
+
+    def formatted(self) -> List[str]:
+        return list(self)
 
     def speak(self, text: str) -> None:
-        rendered = f"[voice:{self.config.language}] {text}"
-        self.history.append(rendered)
+        self.history.append((self._voice_tag, text))
         if self.config.output_mode == "tts":
-            engine = self._load_tts()
-            engine.say(text)
-            engine.runAndWait()
+            self._tts().put(text)
+
+    def speak_stream(self, tokens: Iterable[str]) -> str:
+        """Speak a token stream sentence by sentence as it arrives.
+
+        Each sentence is queued for TTS as soon as its terminator streams in,
+        while later tokens are still being generated. The full response is
+        recorded in ``history`` once the stream ends and is returned.
+        """
+        speech = self._tts() if self.config.output_mode == "tts" else None
+        spoken = []
+        for sentence in self._split_sentences(tokens):
+            spoken.append(sentence)
+            if speech is not None:
+                speech.put(sentence)
+        text = " ".join(spoken)
+        self.history.append((self._voice_tag, text))
+        return text
+
+    @staticmethod
+    def _split_sentences(tokens: Iterable[str]) -> Iterator[str]:
+        buffer = []
+        for token in tokens:
+            buffer.append(token)
+            if token.rstrip().endswith(SENTENCE_END):
+                sentence = "".join(buffer).strip()
+                buffer.clear()
+                if sentence:
+                    yield sentence
+        tail = "".join(buffer).strip()
+        if tail:
+            yield tail
 
     def play_notifications(self, notes: Iterable[str]) -> None:
         for note in notes:
-            self.history.append(f"[notification] {note}")
+            self.history.append(("notification", note))
             if self.config.output_mode == "tts":
-                engine = self._load_tts()
-                engine.say(note)
-        if self.config.output_mode == "tts" and self.history:
+                self._tts().put(note)
+
+    def flush(self) -> None:
+        """Block until everything queued for TTS has been spoken."""
+        if self._tts_queue is not None:
+            self._tts_queue.join()
+
+    def close(self) -> None:
+        """Finish pending speech and stop the TTS worker thread."""
+        if self._tts_queue is None:
+            return
+        self._tts_queue.put(None)
+        self._tts_thread.join()
+        self._tts_queue = None
+        self._tts_thread = None
+
+    # --- TTS worker -----------------------------------------------------
+    def _tts(self) -> "queue.Queue[Optional[str]]":
+        if self._tts_queue is not None:
+            return self._tts_queue
+        texts: "queue.Queue[Optional[str]]" = queue.Queue()
+        ready: Future = Future()
+        thread = threading.Thread(
+            target=self._tts_worker, args=(texts, ready), name="doxibox-tts", daemon=True
+        )
+        thread.start()
+        # pyttsx3 drivers are thread-affine, so the engine is created on the
+        # worker; an init failure (e.g. missing pyttsx3) is re-raised here.
+        ready.result()
+        self._tts_queue = texts
+        self._tts_thread = thread
+        return texts
+
+    def _tts_worker(self, texts: "queue.Queue[Optional[str]]", ready: Future) -> None:
+        try:
             engine = self._load_tts()
-            engine.runAndWait()
+        except Exception as exc:
+            ready.set_exception(exc)
+            return
+        ready.set_result(None)
+        while True:
+            # Everything already queued is rendered in one runAndWait pass.
+            batch = [texts.get()]
+            while True:
+                try:
+                    batch.append(texts.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for text in batch:
+                    if text is not None:
+                        engine.say(text)
+                engine.runAndWait()
+            except Exception:  # keep the worker alive so later speech and flush() still work
+                logger.warning("Text-to-speech failed for %d item(s)", len(batch), exc_info=True)
+            finally:
+                for _ in batch:
+                    texts.task_done()
+            if None in batch:
+                return
 
     def _load_tts(self):
         if self._tts_engine:
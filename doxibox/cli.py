@@ -1,17 +1,27 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+import asyncio
+import queue
+import threading
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, TypeVar
 
 from .agent import AgentOrchestrator
-from .asr import WhisperASR
-from .audio_input import AudioInput
+from .asr import WHISPER_SAMPLE_RATE, BatchingASR, WhisperASR
+from .audio_input import AudioInput, CapturedAudio
 from .audio_output import AudioOutput
 from .config import DoxiConfig
 from .llm import LLMRouter
 from .wakeword import WakeWordDetector
 
+T = TypeVar("T")
 
-def run_cli(prompts: Optional[List[str]] = None, config_dict: dict | None = None) -> List[str]:
+
+def run_cli(
+    prompts: Optional[List[str]] = None,
+    config_dict: dict | None = None,
+    audio_files: Optional[Sequence[str | Path]] = None,
+) -> List[str]:
     """Run the assistant pipeline.
 
     Args:
@@ -19,6 +29,8 @@ def run_cli(prompts: Optional[List[str]] = None, config_dict: dict | None = None
             the configuration sets ``input_mode="microphone"``, the microphone
             capture flow is used.
         config_dict: Optional overrides for :class:`DoxiConfig`.
+        audio_files: Recorded utterances to transcribe instead of live input.
+            They are submitted concurrently and decoded in dynamic batches.
 
     Returns:
         The audio output history, which doubles as a transcript of the TTS layer.
@@ -26,22 +38,117 @@ def run_cli(prompts: Optional[List[str]] = None, config_dict: dict | None = None
 
     config = DoxiConfig.from_dict(config_dict)
     config.ensure_dirs()
+    return asyncio.run(_run_pipeline(config, prompts, audio_files))
+
 
+async def _run_pipeline(
+    config: DoxiConfig,
+    prompts: Optional[List[str]],
+    audio_files: Optional[Sequence[str | Path]] = None,
+) -> List[str]:
     asr = WhisperASR(config)
     llm = LLMRouter(config)
     agent = AgentOrchestrator(config, llm)
     audio_in = AudioInput(config, asr=asr)
     audio_out = AudioOutput(config)
-    detector = WakeWordDetector(config.wake_word)
+    detector = WakeWordDetector([config.wake_word, *config.wake_word_aliases])
+
+    uses_asr = bool(audio_files) or (prompts is None and config.input_mode == "microphone")
+    if config.asr_warmup and uses_asr:
+        await asyncio.to_thread(asr.warmup)
+    if audio_files:
+        stream: Iterable[CapturedAudio] = await _transcribe_files(config, asr, audio_files)
+    else:
+        stream = audio_in.record(prompts)
+    await agent.start()
+    try:
+        # Wake-word filtering runs on the capture thread, so ignored
+        # utterances never reach the event loop.
+        async for text in _iterate_in_thread(detector.iter_triggered(stream)):
+            # The agent sees only the request, so real turns are cached under
+            # the same prompt as prefetched follow-ups ("what about tomorrow").
+            command = detector.command(text)
+            # Speech starts on the first sentence boundary instead of after
+            # the whole completion has been generated.
+            tokens = agent.run_streaming(command)
+            await asyncio.to_thread(audio_out.speak_stream, tokens)
+            agent.submit(command)
+    finally:
+        await agent.close()
+        audio_out.close()
 
-    stream = audio_in.record(prompts)
-    for event in detector.detect(stream):
-        if not event.triggered:
-            continue
-        agent_result = agent.run(event.text)
-        audio_out.speak(agent_result.final_response)
+    return audio_out.formatted()
 
-    return audio_out.history
+
+async def _transcribe_files(
+    config: DoxiConfig, asr: WhisperASR, audio_files: Sequence[str | Path]
+) -> List[CapturedAudio]:
+    batcher = BatchingASR(
+        asr,
+        max_batch_size=config.asr_max_batch,
+        max_wait_s=config.asr_batch_window_ms / 1000.0,
+    )
+
+    async def transcribe(path: str | Path) -> CapturedAudio:
+        audio = await asyncio.to_thread(asr.load_audio, path)
+        segment = await batcher.transcribe(audio)
+        return CapturedAudio(
+            text=segment.text,
+            path=Path(path),
+            sample_rate=WHISPER_SAMPLE_RATE,
+            normalized=segment.normalized,
+        )
+
+    try:
+        return list(await asyncio.gather(*(transcribe(path) for path in audio_files)))
+    finally:
+        await batcher.close()
+
+
+async def _iterate_in_thread(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """Pull from a blocking iterator (microphone capture, ASR) off the event loop.
+
+    Items are produced one at a time on demand by a dedicated daemon thread
+    rather than the default executor: when Ctrl+C cancels the pipeline while
+    the thread is blocked in ``input()``, ``asyncio.run`` does not wait for it
+    and no further capture is started.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = iter(iterable)
+    requests: "queue.SimpleQueue[Optional[asyncio.Future]]" = queue.SimpleQueue()
+    sentinel = object()
+
+    def settle(future: asyncio.Future, item: object, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(item)
+
+    def pump() -> None:
+        while (future := requests.get()) is not None:
+            item, error = sentinel, None
+            try:
+                item = next(iterator, sentinel)
+            except Exception as exc:
+                error = exc
+            try:
+                loop.call_soon_threadsafe(settle, future, item, error)
+            except RuntimeError:  # the loop has already shut down
+                return
+
+    threading.Thread(target=pump, name="doxibox-input", daemon=True).start()
+    try:
+        while True:
+            future = loop.create_future()
+            requests.put(future)
+            item = await future
+            if item is sentinel:
+                return
+            yield item
+    finally:
+        requests.put(None)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual entry point
@@ -59,6 +166,13 @@ if __name__ == "__main__":  # pragma: no cover - manual entry point
         action="store_true",
         help="Enable agent mode with visible reasoning",
     )
+    parser.add_argument(
+        "--file",
+        dest="files",
+        action="append",
+        default=[],
+        help="Transcribe a recorded utterance (repeatable; requires asr extras)",
+    )
     parser.add_argument("prompts", nargs="*", help="Text prompts in text mode")
     args = parser.parse_args()
 
@@ -66,5 +180,7 @@ if __name__ == "__main__":  # pragma: no cover - manual entry point
     if args.mic:
         cfg_overrides["input_mode"] = "microphone"
     config = DoxiConfig.from_dict(cfg_overrides)
-    history = run_cli(prompts=args.prompts or None, config_dict=cfg_overrides)
+    history = run_cli(
+        prompts=args.prompts or None, config_dict=cfg_overrides, audio_files=args.files or None
+    )
     print(json.dumps(history, indent=2))
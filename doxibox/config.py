@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 def _default_model_size() -> str:
@@ -22,6 +22,7 @@ class DoxiConfig:
     """
 
     wake_word: str = "doxi"
+    wake_word_aliases: List[str] = field(default_factory=list)
     model_size: str = field(default_factory=_default_model_size)
     llm_provider: str = field(default_factory=_default_llm_provider)
     language: str = "en"
@@ -29,15 +30,33 @@ class DoxiConfig:
     provider_options: Dict[str, Dict[str, str]] = field(default_factory=dict)
     cache_dir: Path = field(default_factory=lambda: Path(".cache/doxibox"))
     device: str = "auto"
+    backend: str = "auto"  # auto | openai-whisper | transformers | onnx-int8
+    backend_options: Dict[str, str] = field(default_factory=dict)
+    asr_compile: bool = True  # torch.compile the CUDA Whisper decoder
+    assistant_model: str = "auto"  # auto | none | Distil-Whisper repo id for speculative decoding
     enable_agent_mode: bool = False
     input_mode: str = "text"  # text | microphone
     output_mode: str = "text"  # text | tts
+    history_max: int = 1024  # entries kept by AudioOutput; 0 keeps everything
     sample_rate: int = 16000
     channels: int = 1
     max_record_seconds: int = 15
+    persist_captures: bool = False  # also write each capture to cache_dir as WAV
+    asr_batch_size: int = 1  # utterances collected before one batched ASR pass
+    asr_max_batch: int = 8  # dynamic batching limit for concurrent transcriptions
+    asr_batch_window_ms: float = 50.0
+    word_timestamps: bool = False  # per-segment timings (runs Whisper's Numba DTW)
+    asr_warmup: bool = True  # load/JIT the ASR model at startup, not on the first turn
+    use_vad: bool = True  # split recordings longer than 30 s on Silero VAD speech spans
     noise_floor: float = 0.01
     silence_timeout_s: float = 7.0
     logger_level: str = "INFO"
+    response_cache_size: int = 128  # 0 disables the LLM response cache
+    semantic_cache: bool = False  # requires the 'cache' extras
+    semantic_cache_model: str = "all-MiniLM-L6-v2"
+    semantic_cache_threshold: float = 0.92
+    prefetch_followups: bool = False  # background "slow thinker" warms the cache
+    prefetch_max_candidates: int = 3
 
     @classmethod
     def from_dict(cls, data: Optional[Dict[str, object]]) -> "DoxiConfig":
@@ -1,41 +1,210 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Iterable, Iterator, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from .config import DoxiConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
     text: str
     provider: str
 
 
+CacheKey = Tuple[str, str, Optional[str]]
+
+
+def word_chunks(text: str) -> Iterator[str]:
+    """Stream ``text`` word by word; the chunks concatenate back to the text.
+
+    Streaming providers yield deltas (OpenAI-style), so local streams keep the
+    separating space on each chunk rather than yielding bare words.
+    """
+    for index, word in enumerate(text.split()):
+        yield word if index == 0 else f" {word}"
+
+
+class ResponseCache:
+    """Two-tier LRU cache for provider responses.
+
+    The first tier is an exact match on ``(provider, normalized prompt,
+    context)``. The optional semantic tier embeds prompts with a small
+    SentenceTransformer and searches a FAISS inner-product index so that
+    near-duplicate utterances ("hi doxi" / "hey doxi") also skip the provider.
+    Both tiers share one size bound; the oldest entry is evicted first. The
+    cache is guarded by a lock because background prefetch writes to it from
+    worker threads.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        semantic: bool = False,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+    ) -> None:
+        self.max_size = max_size
+        self.semantic = semantic
+        self.model_name = model_name
+        self.threshold = threshold
+        self._entries: "OrderedDict[CacheKey, Tuple[int, LLMResponse]]" = OrderedDict()
+        self._keys_by_id: Dict[int, CacheKey] = {}
+        self._next_id = 0
+        self._encoder = None
+        self._index = None
+        self._last_embedding: Optional[Tuple[str, Any]] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(provider: str, prompt: str, context: Optional[str] = None) -> CacheKey:
+        return (provider, prompt.strip().lower(), context)
+
+    def get(self, provider: str, prompt: str, context: Optional[str] = None) -> Optional[LLMResponse]:
+        if self.max_size <= 0:
+            return None
+        key = self.make_key(provider, prompt, context)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+            if self.semantic and self._entries:
+                return self._semantic_get(key)
+        return None
+
+    def put(
+        self, provider: str, prompt: str, context: Optional[str], response: LLMResponse
+    ) -> None:
+        if self.max_size <= 0:
+            return
+        key = self.make_key(provider, prompt, context)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], response)
+                self._entries.move_to_end(key)
+                return
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[key] = (entry_id, response)
+            self._keys_by_id[entry_id] = key
+            if self.semantic:
+                self._semantic_add(entry_id, key[1])
+            while len(self._entries) > self.max_size:
+                _, (old_id, _) = self._entries.popitem(last=False)
+                self._evict_id(old_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+            self._last_embedding = None
+            if self._index is not None:
+                self._index.reset()
+
+    # --- Semantic tier --------------------------------------------------
+    def _load_semantic(self):
+        if self._index is not None:
+            return self._encoder, self._index
+        try:  # pragma: no cover - optional dependency
+            import faiss  # type: ignore
+            from sentence_transformers import SentenceTransformer  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError(
+                "Semantic caching requires 'sentence-transformers' and 'faiss-cpu'. "
+                "Install with 'pip install doxibox[cache]'"
+            ) from exc
+        self._encoder = SentenceTransformer(self.model_name)
+        dim = self._encoder.get_sentence_embedding_dimension()
+        self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+        return self._encoder, self._index
+
+    def _embed(self, text: str):
+        if self._last_embedding is not None and self._last_embedding[0] == text:
+            return self._last_embedding[1]
+        encoder, _ = self._load_semantic()
+        vector = encoder.encode([text], normalize_embeddings=True, convert_to_numpy=True)
+        vector = vector.astype("float32", copy=False)
+        self._last_embedding = (text, vector)
+        return vector
+
+    def _semantic_get(self, key: CacheKey) -> Optional[LLMResponse]:
+        vector = self._embed(key[1])
+        _, index = self._load_semantic()
+        if index.ntotal == 0:
+            return None
+        scores, ids = index.search(vector, min(4, index.ntotal))
+        for score, entry_id in zip(scores[0], ids[0]):
+            if score < self.threshold:
+                break
+            candidate = self._keys_by_id.get(int(entry_id))
+            # Only reuse answers produced by the same provider for the same context.
+            if candidate is None or candidate[0] != key[0] or candidate[2] != key[2]:
+                continue
+            self._entries.move_to_end(candidate)
+            return self._entries[candidate][1]
+        return None
+
+    def _semantic_add(self, entry_id: int, text: str) -> None:
+        import numpy as np  # lazy import, installed alongside faiss
+
+        vector = self._embed(text)
+        _, index = self._load_semantic()
+        index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+
+    def _evict_id(self, entry_id: int) -> None:
+        self._keys_by_id.pop(entry_id, None)
+        if self._index is not None:
+            import numpy as np  # lazy import
+
+            self._index.remove_ids(np.array([entry_id], dtype=np.int64))
+
+
 class BaseProvider:
     name = "base"
+    # Whether the router may serve repeat prompts from its ResponseCache.
+    cacheable = True
 
     def generate(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
         raise NotImplementedError
 
+    def generate_text(self, prompt: str, context: Optional[str] = None) -> str:
+        return self.generate(prompt, context=context).text
+
+    def generate_many(
+        self, prompts: Sequence[str], context: Optional[str] = None
+    ) -> List[LLMResponse]:
+        return [self.generate(prompt, context=context) for prompt in prompts]
+
     def generate_streaming(self, prompt: str, context: Optional[str] = None) -> Iterator[str]:
         raise NotImplementedError
 
 
 class EchoProvider(BaseProvider):
     name = "local-echo"
+    # Echoing is cheaper than a cache lookup, and near-duplicate hits would
+    # echo the wrong prompt.
+    cacheable = False
 
     def __init__(self, prefix: str = "Doxibox") -> None:
         self.prefix = prefix
 
     def generate(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
-        parts = [self.prefix, "heard:", prompt]
+        return LLMResponse(text=self.generate_text(prompt, context=context), provider=self.name)
+
+    def generate_text(self, prompt: str, context: Optional[str] = None) -> str:
         if context:
-            parts.append(f"(context: {context})")
-        return LLMResponse(text=" ".join(parts), provider=self.name)
+            return f"{self.prefix} heard: {prompt} (context: {context})"
+        return f"{self.prefix} heard: {prompt}"
 
     def generate_streaming(self, prompt: str, context: Optional[str] = None) -> Iterator[str]:
-        yield from self.generate(prompt, context=context).text.split()
+        yield from word_chunks(self.generate_text(prompt, context=context))
 
 
 class ModalProvider(BaseProvider):
@@ -52,15 +221,22 @@ class ModalProvider(BaseProvider):
 
     After setup, configure `DoxiConfig.llm_provider` to `"modal"` and supply a
     `function_path` that points to a deployed Modal function capable of
-    returning a text string. Use the `local-echo` provider instead when
-    operating fully offline.
+    returning a text string; the part after the last ``:`` is the function
+    name and `app_name` is the deployed app. Use the `local-echo` provider
+    instead when operating fully offline.
+
+    The function handle is resolved once and reused, so each prompt costs a
+    single ``.remote()`` round-trip; ``generate_many`` fans prompts out with
+    ``.map()``. Deploy the function as a generator to stream replies.
     """
 
     name = "modal"
 
-    def __init__(self, function_path: str = "doxibox.modal_app:run") -> None:
+    def __init__(self, function_path: str = "doxibox.modal_app:run", app_name: str = "doxibox") -> None:
         self.function_path = function_path
+        self.app_name = app_name
         self._modal = None
+        self._function = None
 
     def _load_client(self):
         if self._modal:
@@ -75,24 +251,42 @@ class ModalProvider(BaseProvider):
         self._modal = modal
         return self._modal
 
-    def generate(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
+    def _load_function(self):  # pragma: no cover - networked dependency
+        if self._function is not None:
+            return self._function
         modal = self._load_client()
-        client = modal.Client()  # pragma: no cover - networked dependency
-        function = client.function_handle(self.function_path)
+        function_name = self.function_path.rsplit(":", 1)[-1]
+        if hasattr(modal.Function, "from_name"):
+            self._function = modal.Function.from_name(self.app_name, function_name)
+        else:  # older modal clients
+            self._function = modal.Function.lookup(self.app_name, function_name)
+        return self._function
+
+    def generate(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
+        function = self._load_function()
         # The remote function should accept a prompt/context and return text.
-        result = function.call(prompt=prompt, context=context)
+        result = function.remote(prompt=prompt, context=context)
         return LLMResponse(text=str(result), provider=self.name)
 
+    def generate_many(
+        self, prompts: Sequence[str], context: Optional[str] = None
+    ) -> List[LLMResponse]:
+        function = self._load_function()
+        results = function.map(list(prompts), [context] * len(prompts))
+        return [LLMResponse(text=str(result), provider=self.name) for result in results]
+
     def generate_streaming(self, prompt: str, context: Optional[str] = None) -> Iterator[str]:
-        modal = self._load_client()
-        client = modal.Client()  # pragma: no cover - networked dependency
-        function = client.function_handle(self.function_path)
-        result = function.call(prompt=prompt, context=context)
-        if isinstance(result, Iterable) and not isinstance(result, (str, bytes)):
-            for chunk in result:
+        """Stream a generator function's chunks through ``.remote_gen()``.
+
+        A plain (non-generator) function is not streamed: its reply arrives
+        from a single ``.remote()`` call and is yielded as one chunk.
+        """
+        function = self._load_function()
+        if getattr(function, "is_generator", False):
+            for chunk in function.remote_gen(prompt=prompt, context=context):
                 yield str(chunk)
-        else:
-            yield str(result)
+            return
+        yield str(function.remote(prompt=prompt, context=context))
 
 
 class OpenAIProvider(BaseProvider):
@@ -141,43 +335,116 @@ class OpenAIProvider(BaseProvider):
 
 
 class LLMRouter:
-    """Minimal provider router with a plugin-friendly surface."""
+    """Minimal provider router with a plugin-friendly surface.
+
+    Configured providers are registered as factories and only instantiated
+    the first time a request is routed to them.
+    """
 
     def __init__(
         self, config: DoxiConfig, providers: Optional[Dict[str, BaseProvider]] = None
     ) -> None:
         self.config = config
         self.providers: Dict[str, BaseProvider] = providers or {}
-        self.providers.setdefault(EchoProvider.name, EchoProvider())
+        self.provider_factories: Dict[str, Callable[[], BaseProvider]] = {
+            EchoProvider.name: EchoProvider
+        }
         self._maybe_register_modal()
         self._maybe_register_openai()
+        self.cache = ResponseCache(
+            max_size=config.response_cache_size,
+            semantic=config.semantic_cache,
+            model_name=config.semantic_cache_model,
+            threshold=config.semantic_cache_threshold,
+        )
 
     def _maybe_register_modal(self) -> None:
         modal_opts = self.config.provider_options.get(ModalProvider.name)
         if modal_opts is None:
             return
         function_path = modal_opts.get("function_path", "doxibox.modal_app:run")
-        self.providers.setdefault(ModalProvider.name, ModalProvider(function_path))
+        app_name = modal_opts.get("app_name", "doxibox")
+        self.provider_factories[ModalProvider.name] = lambda: ModalProvider(function_path, app_name)
 
     def _maybe_register_openai(self) -> None:
         openai_opts = self.config.provider_options.get(OpenAIProvider.name)
         if openai_opts is None:
             return
         model = openai_opts.get("model", "gpt-4o-mini")
-        self.providers.setdefault(OpenAIProvider.name, OpenAIProvider(model))
+        self.provider_factories[OpenAIProvider.name] = lambda: OpenAIProvider(model)
 
     def register(self, provider: BaseProvider) -> None:
         self.providers[provider.name] = provider
+        self.provider_factories[provider.name] = lambda: provider
+
+    def _resolve(self, name: str) -> Optional[BaseProvider]:
+        provider = self.providers.get(name)
+        if provider is None and name in self.provider_factories:
+            provider = self.providers.setdefault(name, self.provider_factories[name]())
+        return provider
 
     def _select(self) -> BaseProvider:
-        return self.providers.get(
-            self.config.llm_provider, self.providers[EchoProvider.name]
-        )
+        provider = self._resolve(self.config.llm_provider)
+        if provider is None:
+            provider = self._resolve(EchoProvider.name)
+        return provider
 
     def generate(self, prompt: str, context: Optional[str] = None) -> LLMResponse:
         provider = self._select()
-        return provider.generate(prompt, context=context)
+        if not provider.cacheable:
+            return provider.generate(prompt, context=context)
+        cached = self.cache.get(provider.name, prompt, context)
+        if cached is not None:
+            return cached
+        response = provider.generate(prompt, context=context)
+        self.cache.put(provider.name, prompt, context, response)
+        return response
+
+    def generate_text(self, prompt: str, context: Optional[str] = None) -> str:
+        """Like :meth:`generate` but returns only the text.
+
+        Uncached providers answer through their own ``generate_text`` so that
+        e.g. the local echo path never allocates an :class:`LLMResponse`.
+        """
+        provider = self._select()
+        if not provider.cacheable:
+            return provider.generate_text(prompt, context=context)
+        return self.generate(prompt, context=context).text
+
+    def generate_many(
+        self, prompts: Sequence[str], context: Optional[str] = None
+    ) -> List[LLMResponse]:
+        """Answer several prompts, sending only the cache misses in one batch."""
+        provider = self._select()
+        if not provider.cacheable:
+            return provider.generate_many(prompts, context=context)
+        responses: List[Optional[LLMResponse]] = [
+            self.cache.get(provider.name, prompt, context) for prompt in prompts
+        ]
+        misses = [index for index, response in enumerate(responses) if response is None]
+        if misses:
+            fresh = provider.generate_many([prompts[index] for index in misses], context=context)
+            for index, response in zip(misses, fresh):
+                self.cache.put(provider.name, prompts[index], context, response)
+                responses[index] = response
+        return responses  # type: ignore[return-value]
 
     def generate_streaming(self, prompt: str, context: Optional[str] = None) -> Iterable[str]:
         provider = self._select()
-        return provider.generate_streaming(prompt, context=context)
+        if not provider.cacheable:
+            return provider.generate_streaming(prompt, context=context)
+        cached = self.cache.get(provider.name, prompt, context)
+        if cached is not None:
+            return word_chunks(cached.text)
+        return self._cache_stream(provider, prompt, context)
+
+    def _cache_stream(
+        self, provider: BaseProvider, prompt: str, context: Optional[str]
+    ) -> Iterator[str]:
+        chunks = []
+        for chunk in provider.generate_streaming(prompt, context=context):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete streams are cached; an abandoned stream stores nothing.
+        response = LLMResponse(text="".join(chunks), provider=provider.name)
+        self.cache.put(provider.name, prompt, context, response)
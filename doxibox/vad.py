@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, List, Sequence, Tuple
+
+from .config import DoxiConfig
+
+Span = Tuple[int, int]
+
+
+class SileroVAD:
+    """Silero voice-activity detector from the ``silero-vad`` package, loaded lazily.
+
+    Used to cut long recordings into speech-only windows that fit Whisper's
+    30 s context so they can be transcribed as one batch. The model ships
+    inside the pinned pip package, so nothing is fetched or executed from a
+    remote repository at runtime.
+    """
+
+    def __init__(self, config: DoxiConfig) -> None:
+        self.config = config
+        self._model = None
+        self._get_speech_timestamps = None
+
+    def _load(self):
+        if self._model is not None:
+            return self._model, self._get_speech_timestamps
+        try:  # pragma: no cover - optional dependency
+            from silero_vad import get_speech_timestamps, load_silero_vad  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError(
+                "VAD segmentation requires 'silero-vad'. Install with 'pip install doxibox[asr]' "
+                "or set use_vad=False."
+            ) from exc
+        self._model = load_silero_vad()
+        self._get_speech_timestamps = get_speech_timestamps
+        return self._model, self._get_speech_timestamps
+
+    def speech_spans(self, audio: Any, sample_rate: int = 16000) -> List[Span]:
+        """Return ``(start, end)`` sample offsets of the detected speech."""
+        import torch
+
+        model, get_speech_timestamps = self._load()
+        timestamps = get_speech_timestamps(
+            torch.as_tensor(audio, dtype=torch.float32), model, sampling_rate=sample_rate
+        )
+        return [(int(stamp["start"]), int(stamp["end"])) for stamp in timestamps]
+
+
+def group_spans(spans: Sequence[Span], max_samples: int) -> List[Span]:
+    """Merge consecutive speech spans into windows of at most ``max_samples``.
+
+    Spans that are longer than a window on their own are cut into consecutive
+    full-size windows plus a remainder.
+    """
+    windows: List[Span] = []
+    current: Span | None = None
+    for start, end in spans:
+        while end - start > max_samples:
+            if current is not None:
+                windows.append(current)
+                current = None
+            windows.append((start, start + max_samples))
+            start += max_samples
+        if current is not None and end - current[0] <= max_samples:
+            current = (current[0], end)
+            continue
+        if current is not None:
+            windows.append(current)
+        current = (start, end)
+    if current is not None:
+        windows.append(current)
+    return windows
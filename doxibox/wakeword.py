@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, Tuple
 
 from .audio_input import CapturedAudio
 
+# Trimmed around a leading wake word and from both ends of the command after it.
+COMMAND_SEPARATORS = " \t\n,.;:!?-"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class WakeWordEvent:
     text: str
     triggered: bool
+    # Stripped, lower-cased text; ``detect`` fills it for every item.
+    normalized: str = ""
 
 
 class WakeWordDetector:
@@ -17,17 +23,94 @@ class WakeWordDetector:
 
     This keeps the interface expandable so that a future DSP-based detector can
     be swapped in without touching the consumer code. For now, it simply checks
-    text fragments for the configured wake word.
+    text fragments for the configured wake words.
+
+    All wake words are compiled into one matcher that scans each utterance in a
+    single pass: an Aho-Corasick automaton when `pyahocorasick` is installed,
+    otherwise a regex alternation. :class:`CapturedAudio` items are matched on
+    their precomputed ``normalized`` text, so no case folding happens here.
     """
 
-    def __init__(self, wake_word: str = "doxi") -> None:
-        self.wake_word = wake_word.lower()
+    def __init__(self, wake_word: str | Iterable[str] = "doxi") -> None:
+        words = [wake_word] if isinstance(wake_word, str) else list(wake_word)
+        self.wake_words = tuple(dict.fromkeys(word.lower() for word in words if word))
+        if not self.wake_words:
+            raise ValueError("WakeWordDetector needs at least one wake word.")
+        self.wake_word = self.wake_words[0]
+        # Longest first, so that "doxibox" is preferred over "doxi" at one position.
+        self._alternation = "|".join(
+            map(re.escape, sorted(self.wake_words, key=len, reverse=True))
+        )
+        self._pattern = re.compile(self._alternation, re.IGNORECASE)
+        self._matches, self._matches_normalized = self._build_matchers()
+
+    def _build_matchers(self) -> Tuple[Callable[[str], bool], Callable[[str], bool]]:
+        """Return matchers for raw text and for already lower-cased text."""
+        try:  # pragma: no cover - optional dependency
+            import ahocorasick  # type: ignore
+        except ImportError:
+            folded = self._pattern
+            exact = re.compile(self._alternation)
+            return (
+                lambda text: folded.search(text) is not None,
+                lambda normalized: exact.search(normalized) is not None,
+            )
+
+        automaton = ahocorasick.Automaton()
+        for word in self.wake_words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+
+        def matches_normalized(normalized: str) -> bool:
+            for _ in automaton.iter(normalized):
+                return True
+            return False
+
+        return (lambda text: matches_normalized(text.lower()), matches_normalized)
+
+    def matches(self, text: str) -> bool:
+        return self._matches(text)
+
+    def command(self, text: str) -> str:
+        """Return the request that follows a leading wake word.
+
+        ``"Doxi, what about tomorrow?"`` becomes ``"what about tomorrow"``. Only
+        a whole wake word at the start of the utterance is removed; otherwise,
+        or when nothing follows it, the stripped text is returned unchanged.
+        """
+        stripped = text.strip()
+        start = len(stripped) - len(stripped.lstrip(COMMAND_SEPARATORS))
+        match = self._pattern.match(stripped, start)
+        if match is None or stripped[match.end() : match.end() + 1].isalnum():
+            return stripped
+        return stripped[match.end() :].strip(COMMAND_SEPARATORS) or stripped
+
+    def iter_triggered(self, stream: Iterable[str | CapturedAudio]) -> Iterator[str]:
+        """Yield the text of each utterance that contains a wake word.
+
+        Unlike :meth:`detect`, ignored utterances cost no event allocation,
+        which matters when the wake word is rare.
+        """
+        matches, matches_normalized = self._matches, self._matches_normalized
+        for item in stream:
+            if isinstance(item, CapturedAudio):
+                if matches_normalized(item.normalized):
+                    yield item.text
+            elif matches(item):
+                yield item
 
     def detect(self, stream: Iterable[str | CapturedAudio]) -> Iterable[WakeWordEvent]:
         for item in stream:
             if isinstance(item, CapturedAudio):
-                text = item.text
+                yield WakeWordEvent(
+                    text=item.text,
+                    triggered=self._matches_normalized(item.normalized),
+                    normalized=item.normalized,
+                )
             else:
-                text = item
-            normalized = text.strip().lower()
-            yield WakeWordEvent(text=text, triggered=self.wake_word in normalized)
+                normalized = item.strip().lower()
+                yield WakeWordEvent(
+                    text=item,
+                    triggered=self._matches_normalized(normalized),
+                    normalized=normalized,
+                )
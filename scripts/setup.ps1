@@ -7,7 +7,7 @@ Write-Host "Welcome to the Doxibox setup (Windows)."
 $inputVenv = Read-Host "Virtualenv directory [$VenvDir]"
 if ($inputVenv) { $VenvDir = $inputVenv }
 
-Write-Host "Select extras to install (comma-separated). Options: dev,audio,tts,asr,llm,modal,full"
+Write-Host "Select extras to install (comma-separated). Options: dev,audio,tts,asr,asr-cuda,asr-onnx,llm,modal,cache,wakeword,full"
 $extrasInput = Read-Host "Extras [dev]"
 if (-not $extrasInput) { $extrasInput = "dev" }
 $Extras = $extrasInput
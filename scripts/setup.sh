@@ -10,7 +10,7 @@ echo "Welcome to the Doxibox setup (macOS/Linux)."
 read -rp "Virtualenv directory [${VENV_DIR}]: " VENV_DIR_INPUT
 VENV_DIR=${VENV_DIR_INPUT:-$VENV_DIR}
 
-echo "Select extras to install (comma-separated). Options: dev,audio,tts,asr,llm,modal,full"
+echo "Select extras to install (comma-separated). Options: dev,audio,tts,asr,asr-cuda,asr-onnx,llm,modal,cache,wakeword,full"
 read -rp "Extras [dev]: " EXTRAS_INPUT
 EXTRAS=${EXTRAS_INPUT:-dev}
 
@@ -0,0 +1,55 @@
+import asyncio
+
+from doxibox import AgentOrchestrator, DoxiConfig, LLMRouter, WakeWordDetector
+from doxibox.agent import FOLLOWUP_CONTEXT
+from doxibox.llm import EchoProvider, LLMResponse
+
+
+class FollowupProvider(EchoProvider):
+    cacheable = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.prompts = []
+
+    def generate(self, prompt, context=None):
+        self.prompts.append(prompt)
+        if context == FOLLOWUP_CONTEXT:
+            return LLMResponse(text="1. what about tomorrow\n2. thanks", provider=self.name)
+        return super().generate(prompt, context=context)
+
+
+def test_slow_thinker_prefetches_followups():
+    provider = FollowupProvider()
+    config = DoxiConfig(prefetch_followups=True)
+    agent = AgentOrchestrator(config, LLMRouter(config, providers={provider.name: provider}))
+    detector = WakeWordDetector(config.wake_word)
+
+    async def scenario():
+        await agent.start()
+        await agent.run_async("doxi weather today")
+        for _ in range(100):
+            if len(provider.prompts) >= 4:
+                break
+            await asyncio.sleep(0.01)
+        await agent.close()
+        # Both predicted follow-ups are now answered from the cache once the
+        # wake word is stripped the way run_cli does it.
+        await agent.run_async(detector.command("Doxi, what about tomorrow?"))
+        await agent.run_async(detector.command("doxi thanks."))
+
+    asyncio.run(scenario())
+    assert provider.prompts[:2] == ["doxi weather today", "doxi weather today"]
+    assert sorted(provider.prompts[2:]) == ["thanks", "what about tomorrow"]
+
+
+def test_parse_followups_strips_only_list_markers():
+    agent = AgentOrchestrator(DoxiConfig(prefetch_max_candidates=5), LLMRouter(DoxiConfig()))
+    text = "1. 5 minute timer\n- 3D printer status\n2) lights off\n\n* what's next\n10 pushups"
+    assert agent._parse_followups(text) == [
+        "5 minute timer",
+        "3D printer status",
+        "lights off",
+        "what's next",
+        "10 pushups",
+    ]
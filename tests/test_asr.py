@@ -0,0 +1,173 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from doxibox import BatchingASR, DoxiConfig
+from doxibox.asr import TranscriptSegment, WhisperASR
+
+
+class RecordingASR:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def transcribe_batch(self, clips):
+        self.batches.append(list(clips))
+        return [TranscriptSegment(text=f"clip {clip}") for clip in clips]
+
+
+def test_batching_asr_groups_concurrent_requests():
+    asr = RecordingASR()
+    batcher = BatchingASR(asr, max_batch_size=2, max_wait_s=0.05)
+
+    async def scenario():
+        try:
+            return await asyncio.gather(*(batcher.transcribe(i) for i in range(5)))
+        finally:
+            await batcher.close()
+
+    segments = asyncio.run(scenario())
+    assert [segment.text for segment in segments] == [f"clip {i}" for i in range(5)]
+    assert asr.batches == [[0, 1], [2, 3], [4]]
+
+
+def test_log_mel_batch_matches_reference_spectrogram():
+    torch = pytest.importorskip("torch")
+    whisper = pytest.importorskip("whisper")
+
+    asr = WhisperASR(DoxiConfig())
+    asr._whisper = SimpleNamespace(dims=SimpleNamespace(n_mels=80))
+    generator = torch.Generator().manual_seed(0)
+    clips = [torch.rand(size, generator=generator) - 0.5 for size in (16000, 48000)]
+    batch = torch.zeros((len(clips), whisper.audio.N_SAMPLES))
+    for row, clip in enumerate(clips):
+        batch[row, : clip.shape[0]] = clip
+
+    mel = asr._log_mel_batch(batch)
+
+    for row, clip in enumerate(clips):
+        expected = whisper.log_mel_spectrogram(whisper.pad_or_trim(clip))
+        assert torch.allclose(mel[row], expected, atol=1e-4)
+
+
+@pytest.mark.parametrize(("model_size", "multilingual"), [("medium.en", False), ("large-v3", True)])
+def test_generate_kwargs_skip_language_for_english_only_models(model_size, multilingual):
+    asr = WhisperASR(DoxiConfig(model_size=model_size, language="en"))
+    model = SimpleNamespace(generation_config=SimpleNamespace(is_multilingual=multilingual))
+    expected = {"language": "en", "task": "transcribe"} if multilingual else {}
+    assert asr._generate_kwargs(model) == expected
+
+
+def test_onnx_backend_explains_missing_default_export(tmp_path):
+    asr = WhisperASR(DoxiConfig(backend="onnx-int8", cache_dir=tmp_path))
+    with pytest.raises(RuntimeError, match="optimum-cli export onnx"):
+        asr._load_model()
+
+
+class SpanVAD:
+    def speech_spans(self, audio, sample_rate=16000):
+        return [(16000, 32000), (40 * 16000, 50 * 16000)]
+
+
+class WindowASR(WhisperASR):
+    def __init__(self, config):
+        super().__init__(config)
+        self.windows = []
+
+    def _decode_batch(self, clips):
+        self.windows.extend(len(clip) for clip in clips)
+        return [TranscriptSegment(text=f"{len(clip) // 16000}s") for clip in clips]
+
+
+def test_batch_splits_long_clips_on_vad_spans():
+    asr = WindowASR(DoxiConfig(use_vad=True))
+    asr._vad = SpanVAD()
+
+    segments = asr.transcribe_batch([[0.0] * (60 * 16000), [0.0] * 16000])
+
+    # Only the speech spans of the long clip are decoded, then joined back.
+    assert asr.windows == [16000, 10 * 16000, 16000]
+    assert [segment.text for segment in segments] == ["1s 10s", "1s"]
+
+
+def test_read_audio_reports_missing_ffmpeg(monkeypatch, tmp_path):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        WhisperASR._read_audio(b"RIFF")
+
+
+def test_load_audio_does_not_load_the_model(monkeypatch):
+    np = pytest.importorskip("numpy")
+    asr = WhisperASR(DoxiConfig())
+    monkeypatch.setattr(asr, "_load_model", lambda: pytest.fail("model loaded for decoding"))
+    monkeypatch.setattr(asr, "_read_audio", lambda path: np.zeros(160, dtype=np.float32))
+
+    assert asr.load_audio("turn.wav").shape == (160,)
+
+
+class FakeWhisperModel:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+        self.audio = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append((len(audio), kwargs))
+        self.audio.append(audio)
+        return self.result
+
+
+def test_word_timestamps_are_off_by_default():
+    np = pytest.importorskip("numpy")
+    asr = WhisperASR(DoxiConfig())
+    asr._whisper = FakeWhisperModel({"text": " Doxi, lights on "})
+
+    segments = asr.transcribe(np.zeros(16000, dtype=np.float32))
+
+    assert asr._whisper.calls == [(16000, {"word_timestamps": False})]
+    assert [(segment.text, segment.start, segment.end) for segment in segments] == [
+        ("Doxi, lights on", None, None)
+    ]
+
+
+def test_word_timestamps_produce_timed_segments():
+    np = pytest.importorskip("numpy")
+    asr = WhisperASR(DoxiConfig(word_timestamps=True))
+    asr._whisper = FakeWhisperModel(
+        {
+            "text": "Doxi. Lights on.",
+            "segments": [
+                {"text": " Doxi.", "start": 0.0, "end": 0.6},
+                {"text": " Lights on.", "start": 0.8, "end": 1.7},
+            ],
+        }
+    )
+
+    segments = asr.transcribe(np.zeros(32000, dtype=np.float32))
+
+    assert asr._whisper.calls == [(32000, {"word_timestamps": True})]
+    assert [(segment.text, segment.start, segment.end) for segment in segments] == [
+        ("Doxi.", 0.0, 0.6),
+        ("Lights on.", 0.8, 1.7),
+    ]
+
+
+def test_warmup_decodes_one_second_of_silence():
+    pytest.importorskip("numpy")
+    asr = WhisperASR(DoxiConfig())
+    asr._whisper = FakeWhisperModel({"text": ""})
+
+    asr.warmup()
+
+    assert asr._whisper.calls == [(16000, {"word_timestamps": False})]
+
+
+def test_arrays_reach_the_model_without_ffmpeg(monkeypatch, tmp_path):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setenv("PATH", str(tmp_path))  # any ffmpeg call would now fail
+    asr = WhisperASR(DoxiConfig())
+    asr._whisper = FakeWhisperModel({"text": "doxi"})
+
+    assert asr.transcribe_text(np.zeros(8000, dtype=np.float64)) == "doxi"
+    (audio,) = asr._whisper.audio
+    assert audio.dtype == np.float32 and audio.shape == (8000,)
@@ -0,0 +1,129 @@
+import threading
+import wave
+
+import pytest
+
+from doxibox import AudioInput, DoxiConfig
+from doxibox.asr import TranscriptSegment
+
+
+np = pytest.importorskip("numpy")
+
+
+class FakeInputStream:
+    """Feeds constant blocks to the callback from a background thread."""
+
+    opened = 0
+
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        FakeInputStream.opened += 1
+        self.blocksize = blocksize
+        self.channels = channels
+        self.callback = callback
+        self._stop = threading.Event()
+
+    def start(self):
+        def pump():
+            block = np.full((self.blocksize, self.channels), 0.5, dtype=np.float32)
+            while not self._stop.is_set():
+                self.callback(block, self.blocksize, None, None)
+                self._stop.wait(0.001)
+
+        threading.Thread(target=pump, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def close(self):
+        pass
+
+
+class FakeSoundDevice:
+    InputStream = FakeInputStream
+
+
+def test_capture_reuses_one_input_stream():
+    FakeInputStream.opened = 0
+    audio_in = AudioInput(DoxiConfig(sample_rate=4096, max_record_seconds=1))
+    first = audio_in._capture_once(FakeSoundDevice)
+    second = audio_in._capture_once(FakeSoundDevice)
+    audio_in.close()
+
+    assert FakeInputStream.opened == 1
+    assert first.shape == second.shape == (4096,)
+    assert np.allclose(second, 0.5)
+
+
+class SingleOrBatchASR:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def transcribe_text(self, clip):
+        self.calls.append("transcribe")
+        return "Doxi lights"
+
+    def transcribe_batch(self, clips):
+        self.calls.append("batch")
+        return [TranscriptSegment(text=f"clip {index}") for index, _ in enumerate(clips)]
+
+
+def test_single_capture_uses_guarded_transcribe_path():
+    asr = SingleOrBatchASR()
+    audio_in = AudioInput(DoxiConfig(), asr=asr)
+    clip = np.zeros(16000, dtype=np.float32)
+
+    (single,) = audio_in._flush([(clip, None)])
+    batched = list(audio_in._flush([(clip, None), (clip, None)]))
+
+    assert asr.calls == ["transcribe", "batch"]
+    assert single.normalized == "doxi lights"
+    assert [captured.text for captured in batched] == ["clip 0", "clip 1"]
+
+
+def test_write_wav_quantizes_and_clips_without_touching_input(tmp_path):
+    audio_in = AudioInput(DoxiConfig(sample_rate=8000, channels=2, max_record_seconds=1))
+    audio_in._soundfile = False  # exercise the stdlib wave path
+    audio = np.array([[0.0, 1.0], [-1.0, 1.5], [-2.0, 0.25], [0.5, -0.5]], dtype=np.float32)
+    original = audio.copy()
+    path = tmp_path / "capture.wav"
+
+    audio_in._write_wav(path, audio, 8000)
+
+    with wave.open(str(path), "rb") as wf:
+        assert (wf.getnchannels(), wf.getsampwidth(), wf.getframerate()) == (2, 2, 8000)
+        assert wf.getnframes() == 4
+        frames = np.frombuffer(wf.readframes(wf.getnframes()), dtype="<i2").reshape(-1, 2)
+    expected = np.rint(np.clip(original, -1.0, 1.0) * 32767).astype(np.int16)
+    assert np.array_equal(frames, expected)
+    assert frames.max() == 32767 and frames.min() == -32767
+    assert np.array_equal(audio, original)
+
+
+def record_once(monkeypatch, config):
+    answers = iter(["", "q"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    audio_in = AudioInput(config, asr=SingleOrBatchASR())
+    audio_in._load_sounddevice = lambda: FakeSoundDevice
+    return list(audio_in.record())
+
+
+def test_microphone_captures_are_not_written_by_default(monkeypatch, tmp_path):
+    config = DoxiConfig(input_mode="microphone", max_record_seconds=1, cache_dir=tmp_path)
+
+    (captured,) = record_once(monkeypatch, config)
+
+    assert captured.text == "Doxi lights"
+    assert captured.path is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_persist_captures_writes_a_wav(monkeypatch, tmp_path):
+    config = DoxiConfig(
+        input_mode="microphone", max_record_seconds=1, cache_dir=tmp_path, persist_captures=True
+    )
+
+    (captured,) = record_once(monkeypatch, config)
+
+    assert captured.path == tmp_path / "capture.wav"
+    with wave.open(str(captured.path), "rb") as wf:
+        assert wf.getnframes() == config.sample_rate
@@ -0,0 +1,80 @@
+import pytest
+
+from doxibox import AudioOutput, DoxiConfig
+
+
+class FakeEngine:
+    def __init__(self) -> None:
+        self.spoken = []
+        self.runs = 0
+
+    def say(self, text):
+        self.spoken.append(text)
+
+    def runAndWait(self):
+        self.runs += 1
+
+
+def test_speak_stream_flushes_on_sentence_boundaries():
+    audio_out = AudioOutput(DoxiConfig(output_mode="tts"))
+    engine = FakeEngine()
+    audio_out._tts_engine = engine
+
+    text = audio_out.speak_stream(["Sure", ".", " It is", " sunny!", " Anything", " else"])
+    audio_out.flush()
+
+    assert engine.spoken == ["Sure.", "It is sunny!", "Anything else"]
+    assert text == "Sure. It is sunny! Anything else"
+    assert audio_out.formatted() == ["[voice:en] Sure. It is sunny! Anything else"]
+
+
+def test_history_is_bounded():
+    audio_out = AudioOutput(DoxiConfig(history_max=2))
+    for text in ("one", "two", "three"):
+        audio_out.speak(text)
+    audio_out.play_notifications(["timer done"])
+    assert list(audio_out) == ["[voice:en] three", "[notification] timer done"]
+
+
+def test_tts_worker_speaks_every_notification():
+    audio_out = AudioOutput(DoxiConfig(output_mode="tts"))
+    engine = FakeEngine()
+    audio_out._tts_engine = engine
+
+    audio_out.play_notifications(["timer done", "rain expected"])
+    audio_out.close()
+
+    assert engine.spoken == ["timer done", "rain expected"]
+    assert engine.runs >= 1
+
+
+class FlakyEngine(FakeEngine):
+    def runAndWait(self):
+        super().runAndWait()
+        if self.runs == 1:
+            raise RuntimeError("driver hiccup")
+
+
+def test_tts_worker_survives_engine_errors():
+    audio_out = AudioOutput(DoxiConfig(output_mode="tts"))
+    engine = FlakyEngine()
+    audio_out._tts_engine = engine
+
+    audio_out.speak("first")
+    audio_out.flush()
+    audio_out.speak("second")
+    audio_out.flush()
+    audio_out.close()
+
+    assert engine.spoken == ["first", "second"]
+
+
+def test_tts_init_failure_is_raised_to_the_caller():
+    audio_out = AudioOutput(DoxiConfig(output_mode="tts"))
+
+    def broken_init():
+        raise RuntimeError("no speech driver")
+
+    audio_out._load_tts = broken_init
+    with pytest.raises(RuntimeError, match="no speech driver"):
+        audio_out.speak("hello")
@@ -1,10 +1,17 @@
+import asyncio
+
+import pytest
+
 from doxibox import run_cli, DoxiConfig
+from doxibox.asr import WHISPER_SAMPLE_RATE, TranscriptSegment, WhisperASR
+from doxibox.cli import _iterate_in_thread, _transcribe_files
 
 
 def test_run_cli_triggers_on_wake_word():
     prompts = ["hello", "Doxi tell me a joke", "bye"]
     outputs = run_cli(prompts)
-    assert outputs == ["[voice:en] Doxibox heard: Doxi tell me a joke"]
+    # Only the request after the wake word reaches the LLM.
+    assert outputs == ["[voice:en] Doxibox heard: tell me a joke"]
 
 
 def test_agent_mode_outputs_steps():
@@ -12,3 +19,69 @@ def test_agent_mode_outputs_steps():
     outputs = run_cli(prompts, {"enable_agent_mode": True})
     # Agent mode still produces audible output, but includes context marker.
     assert "agent-mode" in outputs[0]
+
+
+def test_iterate_in_thread_pulls_on_demand_and_propagates_errors():
+    pulled = []
+
+    def source():
+        for item in ("a", "b"):
+            pulled.append(item)
+            yield item
+        raise ValueError("capture failed")
+
+    async def scenario():
+        seen = []
+        async for item in _iterate_in_thread(source()):
+            # The next item is only pulled once the consumer asks for it.
+            assert pulled[-1] == item
+            seen.append(item)
+        return seen
+
+    with pytest.raises(ValueError, match="capture failed"):
+        asyncio.run(scenario())
+    assert pulled == ["a", "b"]
+
+
+class LongFileASR(WhisperASR):
+    """Decodes nothing; reports the length of every window it is handed."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.windows = []
+
+    def load_audio(self, path):
+        return [0.0] * (45 * WHISPER_SAMPLE_RATE)
+
+    def _decode_batch(self, clips):
+        self.windows.extend(len(clip) for clip in clips)
+        return [TranscriptSegment(text=f"doxi {len(clip)}") for clip in clips]
+
+
+def test_long_recorded_files_are_not_truncated():
+    config = DoxiConfig(use_vad=False)
+    asr = LongFileASR(config)
+
+    (captured,) = asyncio.run(_transcribe_files(config, asr, ["long.wav"]))
+
+    assert asr.windows == [30 * WHISPER_SAMPLE_RATE, 15 * WHISPER_SAMPLE_RATE]
+    assert captured.text == "doxi 480000 doxi 240000"
+
+
+def test_asr_is_warmed_up_only_when_audio_is_transcribed(monkeypatch):
+    warmups = []
+    monkeypatch.setattr(WhisperASR, "warmup", lambda self: warmups.append(self))
+    monkeypatch.setattr(WhisperASR, "load_audio", lambda self, path: [0.0] * WHISPER_SAMPLE_RATE)
+    monkeypatch.setattr(
+        WhisperASR, "_decode_batch", lambda self, clips: [TranscriptSegment("doxi hi") for _ in clips]
+    )
+
+    run_cli(["doxi hello"])
+    assert warmups == []
+
+    outputs = run_cli(audio_files=["turn.wav"])
+    assert len(warmups) == 1
+    assert outputs == ["[voice:en] Doxibox heard: hi"]
+
+    run_cli(audio_files=["turn.wav"], config_dict={"asr_warmup": False})
+    assert len(warmups) == 1
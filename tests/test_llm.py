@@ -0,0 +1,93 @@
+from doxibox import DoxiConfig, LLMRouter
+from doxibox.llm import EchoProvider, ModalProvider
+
+
+class CountingProvider(EchoProvider):
+    cacheable = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def generate_text(self, prompt, context=None):
+        self.calls += 1
+        return super().generate_text(prompt, context=context)
+
+
+def test_router_caches_normalized_prompts():
+    provider = CountingProvider()
+    router = LLMRouter(DoxiConfig(), providers={provider.name: provider})
+    first = router.generate("Doxi, hello")
+    second = router.generate("  doxi, HELLO ")
+    assert provider.calls == 1
+    assert second is first
+    assert "".join(router.generate_streaming("doxi, hello")) == first.text
+
+    router.generate("doxi, hello", context="agent-mode")
+    assert provider.calls == 2
+
+
+def test_response_cache_evicts_oldest_entry():
+    provider = CountingProvider()
+    router = LLMRouter(DoxiConfig(response_cache_size=2), providers={provider.name: provider})
+    for prompt in ("one", "two", "three", "one"):
+        router.generate(prompt)
+    assert provider.calls == 4
+    assert len(router.cache) == 2
+
+
+def test_streamed_responses_are_cached():
+    provider = CountingProvider()
+    router = LLMRouter(DoxiConfig(), providers={provider.name: provider})
+    streamed = "".join(router.generate_streaming("doxi what time is it"))
+    assert router.generate("doxi what time is it").text == streamed
+    assert provider.calls == 1
+
+
+def test_providers_are_instantiated_on_first_use():
+    router = LLMRouter(
+        DoxiConfig(llm_provider="openai", provider_options={"openai": {"model": "gpt-4o"}})
+    )
+    assert "openai" not in router.providers
+    assert router._select().model == "gpt-4o"
+    assert "openai" in router.providers
+
+
+def test_generate_many_only_sends_cache_misses():
+    provider = CountingProvider()
+    router = LLMRouter(DoxiConfig(), providers={provider.name: provider})
+    router.generate("weather")
+    responses = router.generate_many(["Weather", "news", "timer"])
+    assert [response.text for response in responses] == [
+        "Doxibox heard: weather",
+        "Doxibox heard: news",
+        "Doxibox heard: timer",
+    ]
+    assert provider.calls == 3
+
+
+class FakeModalFunction:
+    def __init__(self, is_generator):
+        self.is_generator = is_generator
+        self.calls = []
+
+    def remote(self, prompt, context=None):
+        self.calls.append("remote")
+        return f"reply to {prompt}"
+
+    def remote_gen(self, prompt, context=None):
+        self.calls.append("remote_gen")
+        yield "reply"
+        yield " to"
+        yield f" {prompt}"
+
+
+def test_modal_streams_generator_functions_with_remote_gen():
+    provider = ModalProvider()
+    provider._function = FakeModalFunction(is_generator=True)
+    assert list(provider.generate_streaming("hi")) == ["reply", " to", " hi"]
+    assert provider._function.calls == ["remote_gen"]
+
+    provider._function = FakeModalFunction(is_generator=False)
+    assert list(provider.generate_streaming("hi")) == ["reply to hi"]
+    assert provider._function.calls == ["remote"]
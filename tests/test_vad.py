@@ -0,0 +1,10 @@
+from doxibox.vad import group_spans
+
+
+def test_group_spans_merges_up_to_window_size():
+    spans = [(0, 10), (15, 40), (45, 90), (100, 130)]
+    assert group_spans(spans, max_samples=50) == [(0, 40), (45, 90), (100, 130)]
+
+
+def test_group_spans_splits_overlong_speech():
+    assert group_spans([(5, 130)], max_samples=50) == [(5, 55), (55, 105), (105, 130)]
@@ -0,0 +1,42 @@
+from doxibox import WakeWordDetector
+from doxibox.audio_input import CapturedAudio
+
+
+def test_detector_matches_any_wake_word_case_insensitively():
+    detector = WakeWordDetector(["doxi", "Hey Box"])
+    events = list(detector.detect(["hello", "DOXI lights on", "hey box, timer", "boxing"]))
+    assert [event.triggered for event in events] == [False, True, True, False]
+    assert events[1].text == "DOXI lights on"
+    assert events[1].normalized == "doxi lights on"
+
+
+def test_detector_uses_precomputed_normalized_text():
+    detector = WakeWordDetector("doxi")
+    captured = CapturedAudio(text="  Doxi, play music ")
+    assert captured.normalized == "doxi, play music"
+
+    (event,) = detector.detect([captured])
+    assert event.triggered
+    assert event.text == "  Doxi, play music "
+    assert event.normalized == "doxi, play music"
+
+
+def test_iter_triggered_yields_only_matching_text():
+    detector = WakeWordDetector("doxi")
+    stream = ["hello", CapturedAudio(text="Doxi, lights"), "doxi timer", "bye"]
+    assert list(detector.iter_triggered(stream)) == ["Doxi, lights", "doxi timer"]
+
+
+def test_command_strips_only_a_leading_wake_word():
+    detector = WakeWordDetector(["doxi", "hey doxi"])
+    assert detector.command("Doxi, what about tomorrow?") == "what about tomorrow"
+    assert detector.command("  HEY DOXI - lights off.") == "lights off"
+    assert detector.command(" set a timer ") == "set a timer"
+
+
+def test_command_keeps_trailing_wake_words_and_substrings():
+    detector = WakeWordDetector("doxi")
+    assert detector.command("What's the weather, Doxi?") == "What's the weather, Doxi?"
+    assert detector.command("Play some music doxi") == "Play some music doxi"
+    assert detector.command("doxi") == "doxi"
+    assert detector.command("doxified paradoxical question") == "doxified paradoxical question"